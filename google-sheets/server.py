@@ -1,31 +1,158 @@
 #!/usr/bin/env python3
 # server.py
 
+import asyncio
+import collections
+import contextlib
+import functools
 import os
-from typing import Dict, List
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Any, Dict, List
+import google_auth_httplib2
+import httplib2
 from fastmcp import FastMCP
-from googleapiclient.discovery import build
-from google.oauth2 import service_account
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
 import json
 
+# googleapiclient, google_auth_oauthlib, the service account module and the
+# requests transport are imported where they are used, keeping startup fast
+
 # Create an MCP server
 mcp = FastMCP("GoogleSheets")
 
-# Define scopes for Google Sheets API and Drive API (for listing sheets)
-SCOPES = [
-    'https://www.googleapis.com/auth/spreadsheets',
-    'https://www.googleapis.com/auth/drive.readonly'  # Added for listing sheets
-]
+# Scope sets requested by each kind of tool
+SHEETS_RW_SCOPES = ('https://www.googleapis.com/auth/spreadsheets',)
+SHEETS_RO_SCOPES = ('https://www.googleapis.com/auth/spreadsheets.readonly',)
+DRIVE_METADATA_RO_SCOPES = ('https://www.googleapis.com/auth/drive.metadata.readonly',)  # For listing sheets
+
+# Scopes granted when a user authorizes the server via OAuth (a superset of the above)
+SCOPES = [*SHEETS_RW_SCOPES, 'https://www.googleapis.com/auth/drive.readonly']
 
 # Environment variable for credentials
 CREDENTIALS_FILE = os.environ.get('GOOGLE_CREDENTIALS_FILE', 'credentials.json')
 TOKEN_FILE = os.environ.get('GOOGLE_TOKEN_FILE', 'token.json')
 
-def get_credentials():
-    """Get Google API credentials from environment or file"""
+# Cached tokens are refreshed once they are this close to expiring
+TOKEN_REFRESH_MARGIN = timedelta(seconds=60)
+
+# Socket timeout (seconds) for Google API connections
+HTTP_TIMEOUT = int(os.environ.get('GOOGLE_HTTP_TIMEOUT', '30'))
+
+# Maximum concurrent Google API requests (one worker thread and connection each)
+MAX_CONNECTIONS = int(os.environ.get('GOOGLE_MAX_CONNS', '10'))
+
+# Retries for rate-limited (429) and server error (5xx) responses, with exponential backoff and jitter
+NUM_RETRIES = int(os.environ.get('GOOGLE_NUM_RETRIES', '5'))
+RETRY_MAX_WAIT = 30  # seconds
+
+# Server errors worth retrying
+_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+# Writes that can be resent safely since they set values rather than add them. Other
+# writes (appends, structural batchUpdates) are only retried after a 429, which means
+# the request was not applied.
+_IDEMPOTENT_WRITES = frozenset({
+    'sheets.spreadsheets.values.update',
+    'sheets.spreadsheets.values.batchUpdate',
+})
+
+# Client-side request rate limits per minute, matching the per-user Sheets API quotas (0 disables)
+READS_PER_MINUTE = int(os.environ.get('GOOGLE_READS_PER_MINUTE', '60'))
+WRITES_PER_MINUTE = int(os.environ.get('GOOGLE_WRITES_PER_MINUTE', '60'))
+if READS_PER_MINUTE < 0 or WRITES_PER_MINUTE < 0:
+    raise ValueError("GOOGLE_READS_PER_MINUTE and GOOGLE_WRITES_PER_MINUTE must not be negative")
+
+# Precompiled patterns for cell references, ranges and rgb() colors
+_CELL_RE = re.compile(r'([A-Z]+)(\d+)')
+_RANGE_RE = re.compile(r'([A-Z]+)(\d+):([A-Z]+)(\d+)')
+_RGB_RE = re.compile(r'rgb\((\d+),\s*(\d+),\s*(\d+)\)')
+
+# Text format options copied as-is; foregroundColor is parsed separately
+_TEXT_FORMAT_KEYS = ('bold', 'italic', 'fontFamily', 'fontSize')
+
+# Named colors accepted by parse_color as (red, green, blue); tuples so the shared table can't be mutated
+_NAMED_COLORS = MappingProxyType({
+    'black': (0, 0, 0),
+    'white': (1, 1, 1),
+    'red': (1, 0, 0),
+    'green': (0, 1, 0),
+    'blue': (0, 0, 1),
+    'yellow': (1, 1, 0),
+    'purple': (0.5, 0, 0.5),
+    'orange': (1, 0.65, 0),
+    'gray': (0.5, 0.5, 0.5)
+})
+
+# Credentials and service clients are built once per scope set and shared across tool calls
+_CREDS: Dict[frozenset, Any] = {}
+_SERVICES: Dict[tuple, Any] = {}
+_SERVICE_LOCK = threading.Lock()
+
+# Sheet IDs by title for each spreadsheet, with the time they were fetched
+SHEET_ID_CACHE_TTL = 60  # seconds
+_SHEET_IDS: Dict[str, tuple] = {}
+# Bumped after each structural change, so fetches started before it aren't cached
+_SHEET_ID_GENERATIONS: Dict[str, int] = {}
+
+def get_credentials(scopes=SHEETS_RW_SCOPES):
+    """Get Google API credentials for a scope set, reusing the cached ones until they expire"""
+    key = frozenset(scopes)
+    creds = _CREDS.get(key)
+    if creds is None:
+        with _SERVICE_LOCK:
+            creds = _CREDS.get(key)
+            if creds is None:
+                creds = _CREDS[key] = _load_credentials(scopes)
+    return _refresh_credentials(creds)
+
+def _refresh_credentials(creds):
+    """Refresh credentials in place shortly before they expire, saving refreshed user tokens
+    
+    Called before every request, so worker threads never refresh the token themselves.
+    """
+    # Fast path: no locking or file access while the token has time left
+    if _has_time_left(creds):
+        return creds
+    
+    with _SERVICE_LOCK:
+        # Another thread may have refreshed while this one waited
+        if not _has_time_left(creds):
+            # Refresh in place so services built with these credentials see the new token
+            from google.auth.transport.requests import Request
+            creds.refresh(Request())
+            if isinstance(creds, Credentials):
+                _save_token(creds)
+        return creds
+
+def _has_time_left(creds) -> bool:
+    """Check that credentials are valid and not about to expire"""
+    if not creds.valid:
+        return False
+    if creds.expiry is None:
+        return True
+    # google-auth stores expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return creds.expiry - now > TOKEN_REFRESH_MARGIN
+
+def _save_token(creds):
+    """Write the token file atomically so concurrent readers never see a partial file"""
+    tmp_file = f"{TOKEN_FILE}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as token:
+        token.write(creds.to_json())
+    os.replace(tmp_file, TOKEN_FILE)
+
+def _load_credentials(scopes):
+    """Load Google API credentials from environment or file
+    
+    Service accounts get a token limited to the requested scopes. OAuth user tokens
+    carry whatever scopes the user granted (SCOPES) and are shared by every scope set.
+    """
     creds = None
     
     # Check if we have a token file
@@ -37,109 +164,438 @@ def get_credentials():
     if not creds or not creds.valid:
         # Check if we can refresh
         if creds and creds.expired and creds.refresh_token:
+            from google.auth.transport.requests import Request
             creds.refresh(Request())
+            _save_token(creds)
         # Check if we have service account credentials
         elif os.path.exists(CREDENTIALS_FILE):
             # Check if it's a service account key
+            from google.oauth2 import service_account
             try:
                 creds = service_account.Credentials.from_service_account_file(
-                    CREDENTIALS_FILE, scopes=SCOPES)
+                    CREDENTIALS_FILE, scopes=list(scopes))
             except ValueError:
                 # If not a service account, it's a client secret
+                from google_auth_oauthlib.flow import InstalledAppFlow
                 flow = InstalledAppFlow.from_client_secrets_file(CREDENTIALS_FILE, SCOPES)
                 creds = flow.run_local_server(port=0)
                 
-            # Save the credentials for the next run
-            with open(TOKEN_FILE, 'w', encoding='utf-8') as token:
-                token.write(creds.to_json())
+                # Save the user's token for the next run; service account keys aren't saved
+                _save_token(creds)
         else:
             raise ValueError("No valid credentials found. Please set GOOGLE_CREDENTIALS_FILE environment variable.")
     
     return creds
 
-def get_sheets_service():
-    """Build and return the Google Sheets service"""
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
-    return service.spreadsheets()
+async def _service(api: str, version: str, scopes):
+    """Return the Google API service for a scope set, building it on first use"""
+    service = _SERVICES.get((api, version, frozenset(scopes)))
+    if service is not None:
+        # Tokens are refreshed by _execute before each request
+        return service
+    
+    # Loading, refreshing or authorizing credentials blocks on file and network I/O
+    return await asyncio.to_thread(_build_service, api, version, scopes)
+
+def _build_service(api: str, version: str, scopes):
+    """Build (once per scope set) a Google API service"""
+    key = (api, version, frozenset(scopes))
+    creds = get_credentials(scopes)
+    with _SERVICE_LOCK:
+        if key not in _SERVICES:
+            # Use the discovery document bundled with googleapiclient instead of fetching it
+            from googleapiclient.discovery import build
+            _SERVICES[key] = build(
+                api, version,
+                http=_authorized_http(creds),
+                cache_discovery=False,
+                static_discovery=True
+            )
+        return _SERVICES[key]
+
+async def get_sheets_service(scopes=SHEETS_RW_SCOPES):
+    """Return the Google Sheets service for a scope set"""
+    return (await _service('sheets', 'v4', scopes)).spreadsheets()
+
+async def get_drive_service(scopes=DRIVE_METADATA_RO_SCOPES):
+    """Return the Google Drive service for a scope set"""
+    return await _service('drive', 'v3', scopes)
 
-def get_drive_service():
-    """Build and return the Google Drive service"""
-    creds = get_credentials()
-    return build('drive', 'v3', credentials=creds)
+def _authorized_http(credentials):
+    """Create an authorized HTTP client whose connections are kept alive between requests"""
+    # No response cache; httplib2 already sends Accept-Encoding: gzip
+    return google_auth_httplib2.AuthorizedHttp(
+        credentials,
+        http=httplib2.Http(cache=None, timeout=HTTP_TIMEOUT)
+    )
+
+# httplib2 is not thread-safe, so each worker thread keeps its own connection.
+# Bounding the pool bounds the number of open connections.
+_API_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONNECTIONS, thread_name_prefix='google-api')
+_THREAD_LOCAL = threading.local()
+
+def _thread_http(credentials):
+    """Return the calling thread's authorized HTTP client for the given credentials"""
+    clients = getattr(_THREAD_LOCAL, 'clients', None)
+    if clients is None:
+        clients = _THREAD_LOCAL.clients = {}
+    http = clients.get(id(credentials))
+    if http is None or http.credentials is not credentials:
+        http = clients[id(credentials)] = _authorized_http(credentials)
+    return http
+
+class _RateLimiter:
+    """Allow at most `per_minute` requests in any rolling 60 second window, the way quotas are counted"""
+    
+    __slots__ = ('_sent', '_lock')
+    
+    def __init__(self, per_minute: int):
+        # Start times of the last per_minute requests
+        self._sent = collections.deque(maxlen=per_minute) if per_minute else None
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a request may be sent"""
+        if self._sent is None:
+            return
+        
+        # Waiters are served in arrival order
+        async with self._lock:
+            if len(self._sent) == self._sent.maxlen:
+                wait = self._sent[0] + 60 - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            self._sent.append(time.monotonic())
+
+# Waiting here is cheaper than a 429 followed by backoff retries
+_READ_LIMIT = _RateLimiter(READS_PER_MINUTE)
+_WRITE_LIMIT = _RateLimiter(WRITES_PER_MINUTE)
+_NO_LIMIT = _RateLimiter(0)
+
+async def _execute(request):
+    """Execute a Google API request in a worker thread so the event loop is not blocked
+    
+    Rate-limited requests, and server errors for requests that are safe to resend, are
+    retried up to NUM_RETRIES times. Timeouts and connection errors are not retried,
+    since the request may already have been applied.
+    """
+    from googleapiclient.errors import HttpError
+    
+    # Every read (values.get/batchGet, spreadsheets.get, files.list) is a GET
+    is_read = request.method == 'GET'
+    idempotent = is_read or request.methodId in _IDEMPOTENT_WRITES
+    
+    # Only Sheets requests count against the Sheets quotas; Drive's files.list isn't throttled
+    if not request.methodId.startswith('sheets.'):
+        limit = _NO_LIMIT
+    else:
+        limit = _READ_LIMIT if is_read else _WRITE_LIMIT
+    loop = asyncio.get_running_loop()
+    
+    for attempt in range(NUM_RETRIES + 1):
+        await limit.acquire()
+        try:
+            return await loop.run_in_executor(
+                _API_EXECUTOR,
+                lambda: request.execute(http=_thread_http(_refresh_credentials(request.http.credentials)))
+            )
+        except HttpError as e:
+            retryable = e.status_code == 429 or (idempotent and e.status_code in _RETRY_STATUSES)
+            if not retryable or attempt == NUM_RETRIES:
+                raise
+            # Waiting on the event loop frees the worker thread for other requests
+            await asyncio.sleep(_retry_delay(e, attempt))
+
+def _retry_delay(error, attempt: int) -> float:
+    """Seconds to wait before retrying, at most RETRY_MAX_WAIT: the server's Retry-After,
+    or exponential backoff with full jitter
+    """
+    retry_after = error.resp.get('retry-after', '')
+    if retry_after.isdigit():
+        return min(RETRY_MAX_WAIT, float(retry_after))
+    return random.uniform(0, min(RETRY_MAX_WAIT, 2 ** attempt))
+
+# Request batching
+
+# Pending calls are flushed when this many are queued...
+BATCH_MAX = 100
+# ...or when the oldest one has waited this long
+BATCH_WAIT_MS = 20
+# Batched requests in flight at once, kept low to stay within Sheets API quotas
+BATCH_CONCURRENCY = 10
+
+def _is_request_error(error) -> bool:
+    """Check whether the API rejected a request as invalid (4xx other than rate limiting)"""
+    from googleapiclient.errors import HttpError
+    return isinstance(error, HttpError) and 400 <= error.status_code < 500 and error.status_code != 429
+
+class _Batcher:
+    """Coalesce concurrent single-range calls into one batched request per group
+    
+    Subclasses implement _send(), which issues the batched request for one group
+    and returns one result per item, in order.
+    """
+    
+    __slots__ = ('_queue', '_task', '_semaphore', '_flushes')
+    
+    def __init__(self):
+        self._queue = None
+        self._task = None
+        self._semaphore = None
+        self._flushes = set()
+    
+    async def submit(self, group, item):
+        """Queue an item and wait for its part of the batched response"""
+        # The flusher is started lazily since it needs the server's running event loop
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+            self._task = asyncio.create_task(self._run())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((group, item, future))
+        return await future
+    
+    async def _run(self):
+        """Collect queued items into batches and flush them"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + BATCH_WAIT_MS / 1000
+            while len(batch) < BATCH_MAX:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Flushed in the background so a slow batch doesn't hold up later ones;
+            # the semaphore bounds how many requests are in flight
+            flush = asyncio.create_task(self._flush(batch))
+            self._flushes.add(flush)
+            flush.add_done_callback(self._flushes.discard)
+    
+    async def _flush(self, batch):
+        """Send one batched request per group, concurrently, and resolve the waiting callers"""
+        groups = {}
+        for group, item, future in batch:
+            groups.setdefault(group, []).append((item, future))
+        
+        async with asyncio.TaskGroup() as tg:
+            for group, entries in groups.items():
+                tg.create_task(self._flush_group(group, entries))
+    
+    async def _flush_group(self, group, entries):
+        """Send one group's items; errors go to its callers, not to other groups"""
+        try:
+            async with self._semaphore:
+                results = await self._send(group, [item for item, _ in entries])
+        except Exception as e:
+            if len(entries) > 1 and _is_request_error(e):
+                # One bad item rejects the whole batch, so send each item on its own
+                # to give every caller its own result or error
+                await asyncio.gather(*(self._flush_group(group, [entry]) for entry in entries))
+                return
+            for _, future in entries:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for index, (_, future) in enumerate(entries):
+            if future.done():
+                continue
+            if index < len(results):
+                future.set_result(results[index])
+            else:
+                future.set_exception(RuntimeError("No response for batched request"))
+    
+    async def _send(self, group, items) -> List:
+        raise NotImplementedError
+
+class _WriteBatcher(_Batcher):
+    """Coalesce (range, values) writes into one values.batchUpdate per (spreadsheet, input option)
+    
+    A batch rejected because of one invalid write applies none of them, so the
+    writes are then resent one per request.
+    """
+    
+    __slots__ = ()
+    
+    async def submit(self, group, item):
+        _forget_inflight(group[0])
+        return await super().submit(group, item)
+    
+    async def _send(self, group, writes) -> List[Dict]:
+        spreadsheet_id, value_input_option = group
+        sheets = await get_sheets_service()
+        body = {
+            'valueInputOption': value_input_option,
+            'includeValuesInResponse': False,  # Only the update counts are needed
+            'data': [{'range': sheet_range, 'values': values} for sheet_range, values in writes]
+        }
+        with _writing(spreadsheet_id):
+            result = await _execute(sheets.values().batchUpdate(
+                spreadsheetId=spreadsheet_id,
+                body=body
+            ))
+        
+        # Responses come back in the same order as the data entries
+        return [
+            {
+                'updated_cells': response.get('updatedCells'),
+                'updated_range': response.get('updatedRange')
+            }
+            for response in result.get('responses', [])
+        ]
+
+class _ReadBatcher(_Batcher):
+    """Coalesce range reads into one values.batchGet per (spreadsheet, render option)
+    
+    An invalid range fails the whole batchGet, so the ranges are then read one
+    per request.
+    """
+    
+    __slots__ = ()
+    
+    async def _send(self, group, ranges) -> List[List[List[Any]]]:
+        spreadsheet_id, value_render_option = group
+        sheets = await get_sheets_service(SHEETS_RO_SCOPES)
+        result = await _execute(sheets.values().batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=ranges,
+            valueRenderOption=value_render_option,
+            fields='valueRanges.values'
+        ))
+        
+        # Value ranges come back in the same order as the requested ranges
+        return [value_range.get('values', []) for value_range in result.get('valueRanges', [])]
+
+_WRITES = _WriteBatcher()
+_READS = _ReadBatcher()
+
+# Identical calls already in flight, keyed by call and arguments
+_INFLIGHT: Dict[tuple, asyncio.Future] = {}
+
+async def _single_flight(key: tuple, call):
+    """Run call() once for concurrent callers with the same key and share its result
+    
+    Keys start with the call name and spreadsheet ID, so _forget_inflight can find them.
+    """
+    future = _INFLIGHT.get(key)
+    if future is None:
+        future = asyncio.ensure_future(call())
+        _INFLIGHT[key] = future
+        
+        def forget(done):
+            # The key may have been forgotten and reused by a newer call
+            if _INFLIGHT.get(key) is done:
+                del _INFLIGHT[key]
+        future.add_done_callback(forget)
+    
+    # Shielded so one caller being cancelled doesn't cancel the call for the others
+    return await asyncio.shield(future)
+
+def _forget_inflight(spreadsheet_id: str):
+    """Stop sharing in-flight calls for a spreadsheet that is being written to
+    
+    Calls already in flight may miss the write, so callers arriving after it get a new call.
+    """
+    for key in [key for key in _INFLIGHT if key[1] == spreadsheet_id]:
+        del _INFLIGHT[key]
+
+@contextlib.contextmanager
+def _writing(spreadsheet_id: str):
+    """Forget in-flight calls for a spreadsheet both before and after writing to it
+    
+    Calls started while the write is in flight may miss it too, so callers arriving
+    after the write has returned always get a new call.
+    """
+    _forget_inflight(spreadsheet_id)
+    try:
+        yield
+    finally:
+        _forget_inflight(spreadsheet_id)
 
 # Data Operations
 
 @mcp.tool()
-def read_sheet(spreadsheet_id: str, sheet_range: str) -> List[List[str]]:
+async def read_sheet(
+    spreadsheet_id: str,
+    sheet_range: str,
+    value_render_option: str = 'UNFORMATTED_VALUE'
+) -> List[List[Any]]:
     """Read data from a Google Sheet
     
     Args:
         spreadsheet_id: The ID of the spreadsheet
         sheet_range: The range to read (e.g., 'Sheet1!A1:D10')
+        value_render_option: How values are rendered: 'UNFORMATTED_VALUE' (raw numbers,
+            dates as serial numbers), 'FORMATTED_VALUE' (as displayed) or 'FORMULA'
         
     Returns:
         The data from the specified range
     """
-    sheets = get_sheets_service()
-    result = sheets.values().get(
-        spreadsheetId=spreadsheet_id,
-        range=sheet_range
-    ).execute()
-    
-    return result.get('values', [])
+    # Identical reads share one request, which is batched with other reads of the same spreadsheet
+    return await _single_flight(
+        ('read_sheet', spreadsheet_id, sheet_range, value_render_option),
+        lambda: _READS.submit((spreadsheet_id, value_render_option), sheet_range)
+    )
 
 @mcp.tool()
-def write_sheet(spreadsheet_id: str, sheet_range: str, values: List[List[str]]) -> Dict:
+async def write_sheet(
+    spreadsheet_id: str,
+    sheet_range: str,
+    values: List[List[Any]],
+    value_input_option: str = 'USER_ENTERED'
+) -> Dict:
     """Write data to a Google Sheet
     
     Args:
         spreadsheet_id: The ID of the spreadsheet
         sheet_range: The range to write to (e.g., 'Sheet1!A1:D10')
         values: The data to write
+        value_input_option: 'USER_ENTERED' (parsed as if typed, so formulas and dates
+            are converted) or 'RAW' (stored exactly as given, skipping parsing)
         
     Returns:
         Status of the operation
     """
-    sheets = get_sheets_service()
-    body = {
-        'values': values
-    }
-    result = sheets.values().update(
-        spreadsheetId=spreadsheet_id,
-        range=sheet_range,
-        valueInputOption='USER_ENTERED',
-        body=body
-    ).execute()
-    
-    return {
-        'updated_cells': result.get('updatedCells'),
-        'updated_range': result.get('updatedRange')
-    }
+    # Batched with other writes made at the same time
+    return await _WRITES.submit((spreadsheet_id, value_input_option), (sheet_range, values))
 
 @mcp.tool()
-def append_sheet(spreadsheet_id: str, sheet_range: str, values: List[List[str]]) -> Dict:
+async def append_sheet(
+    spreadsheet_id: str,
+    sheet_range: str,
+    values: List[List[Any]],
+    value_input_option: str = 'USER_ENTERED'
+) -> Dict:
     """Append data to a Google Sheet
     
     Args:
         spreadsheet_id: The ID of the spreadsheet
         sheet_range: The range to append to (e.g., 'Sheet1!A1')
         values: The data to append
+        value_input_option: 'USER_ENTERED' or 'RAW' (see write_sheet)
         
     Returns:
         Status of the operation
     """
-    sheets = get_sheets_service()
+    sheets = await get_sheets_service()
     body = {
         'values': values
     }
-    result = sheets.values().append(
-        spreadsheetId=spreadsheet_id,
-        range=sheet_range,
-        valueInputOption='USER_ENTERED',
-        insertDataOption='INSERT_ROWS',
-        body=body
-    ).execute()
+    with _writing(spreadsheet_id):
+        result = await _execute(sheets.values().append(
+            spreadsheetId=spreadsheet_id,
+            range=sheet_range,
+            valueInputOption=value_input_option,
+            includeValuesInResponse=False,
+            insertDataOption='INSERT_ROWS',
+            body=body
+        ))
     
     return {
         'updated_cells': result.get('updates', {}).get('updatedCells'),
@@ -147,7 +603,7 @@ def append_sheet(spreadsheet_id: str, sheet_range: str, values: List[List[str]])
     }
 
 @mcp.tool()
-def update_cell(spreadsheet_id: str, sheet_name: str, cell: str, value: str) -> Dict:
+async def update_cell(spreadsheet_id: str, sheet_name: str, cell: str, value: str) -> Dict:
     """Update a single cell in a Google Sheet
     
     Args:
@@ -159,27 +615,66 @@ def update_cell(spreadsheet_id: str, sheet_name: str, cell: str, value: str) ->
     Returns:
         Status of the operation
     """
-    sheet_range = f"{sheet_name}!{cell}"
-    sheets = get_sheets_service()
-    body = {
-        'values': [[value]]
-    }
-    result = sheets.values().update(
+    # Batched with other writes made at the same time
+    return await _WRITES.submit((spreadsheet_id, 'USER_ENTERED'), (f"{sheet_name}!{cell}", [[value]]))
+
+@mcp.tool()
+async def batch_read_sheet(
+    spreadsheet_id: str,
+    ranges: List[str],
+    value_render_option: str = 'UNFORMATTED_VALUE'
+) -> Dict[str, List[List[Any]]]:
+    """Read several ranges from a Google Sheet in one request
+    
+    Args:
+        spreadsheet_id: The ID of the spreadsheet
+        ranges: The ranges to read (e.g., ['Sheet1!A1:D10', 'Sheet2!B2:C5'])
+        value_render_option: How values are rendered: 'UNFORMATTED_VALUE',
+            'FORMATTED_VALUE' or 'FORMULA'
+        
+    Returns:
+        Dictionary mapping each requested range to its data
+    """
+    sheets = await get_sheets_service(SHEETS_RO_SCOPES)
+    result = await _execute(sheets.values().batchGet(
         spreadsheetId=spreadsheet_id,
-        range=sheet_range,
-        valueInputOption='USER_ENTERED',
-        body=body
-    ).execute()
+        ranges=ranges,
+        valueRenderOption=value_render_option,
+        fields='valueRanges.values'
+    ))
     
+    # Value ranges come back in request order, with normalized range names
     return {
-        'updated_cells': result.get('updatedCells'),
-        'updated_range': result.get('updatedRange')
+        sheet_range: value_range.get('values', [])
+        for sheet_range, value_range in zip(ranges, result.get('valueRanges', []))
     }
 
+@mcp.tool()
+async def batch_write_sheet(
+    spreadsheet_id: str,
+    data: Dict[str, List[List[Any]]],
+    value_input_option: str = 'USER_ENTERED'
+) -> Dict:
+    """Write data to several ranges of a Google Sheet in one request
+    
+    Args:
+        spreadsheet_id: The ID of the spreadsheet
+        data: Dictionary mapping ranges to the data to write (e.g., {"Sheet1!A1:B2": [["a", "b"], ["c", "d"]]})
+        value_input_option: 'USER_ENTERED' or 'RAW' (see write_sheet)
+        
+    Returns:
+        Status of the operation
+    """
+    return await _batch_update_values(
+        spreadsheet_id,
+        [{'range': sheet_range, 'values': values} for sheet_range, values in data.items()],
+        value_input_option
+    )
+
 # Formula Operations
 
 @mcp.tool()
-def add_formula(spreadsheet_id: str, sheet_name: str, cell: str, formula: str) -> Dict:
+async def add_formula(spreadsheet_id: str, sheet_name: str, cell: str, formula: str) -> Dict:
     """Add a formula to a cell
     
     Args:
@@ -194,26 +689,12 @@ def add_formula(spreadsheet_id: str, sheet_name: str, cell: str, formula: str) -
     # Ensure formula starts with =
     if not formula.startswith('='):
         formula = f"={formula}"
-        
-    sheet_range = f"{sheet_name}!{cell}"
-    sheets = get_sheets_service()
-    body = {
-        'values': [[formula]]
-    }
-    result = sheets.values().update(
-        spreadsheetId=spreadsheet_id,
-        range=sheet_range,
-        valueInputOption='USER_ENTERED',  # USER_ENTERED interprets formulas
-        body=body
-    ).execute()
     
-    return {
-        'updated_cells': result.get('updatedCells'),
-        'updated_range': result.get('updatedRange')
-    }
+    # Batched with other writes; USER_ENTERED interprets formulas
+    return await _WRITES.submit((spreadsheet_id, 'USER_ENTERED'), (f"{sheet_name}!{cell}", [[formula]]))
 
 @mcp.tool()
-def batch_add_formulas(
+async def batch_add_formulas(
     spreadsheet_id: str, 
     sheet_name: str, 
     cell_formulas: Dict[str, str]
@@ -228,67 +709,27 @@ def batch_add_formulas(
     Returns:
         Status of the operation
     """
-    sheets = get_sheets_service()
-    
-    # Group cells by row for efficiency
-    row_data = {}
+    # One single-cell range per formula so no cells in between are overwritten
+    batch_data = []
     for cell, formula in cell_formulas.items():
+        if not _CELL_RE.match(cell):
+            continue
+        
         # Ensure formula starts with =
         if not formula.startswith('='):
             formula = f"={formula}"
-            
-        # Extract row and column from cell reference
-        import re
-        match = re.match(r'([A-Z]+)(\d+)', cell)
-        if not match:
-            continue
-            
-        col, row = match.groups()
-        if row not in row_data:
-            row_data[row] = {}
-        row_data[row][col] = formula
-    
-    # Create batch update request
-    batch_data = []
-    for row, cols in row_data.items():
-        # Find min and max columns
-        col_indices = [ord(col) - ord('A') for col in cols.keys()]
-        min_col = chr(min(col_indices) + ord('A'))
-        max_col = chr(max(col_indices) + ord('A'))
         
-        # Create range and values
-        range_str = f"{sheet_name}!{min_col}{row}:{max_col}{row}"
-        values = [''] * (max(col_indices) - min(col_indices) + 1)
-        
-        # Fill in values
-        for col, formula in cols.items():
-            col_idx = ord(col) - ord(min_col)
-            values[col_idx] = formula
-            
         batch_data.append({
-            'range': range_str,
-            'values': [values]
+            'range': f"{sheet_name}!{cell}",
+            'values': [[formula]]
         })
     
-    # Execute batch update
-    body = {
-        'valueInputOption': 'USER_ENTERED',
-        'data': batch_data
-    }
-    result = sheets.values().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
-    
-    return {
-        'total_updated_cells': result.get('totalUpdatedCells'),
-        'total_updated_sheets': result.get('totalUpdatedSheets')
-    }
+    return await _batch_update_values(spreadsheet_id, batch_data)
 
 # Formatting Operations
 
 @mcp.tool()
-def format_range(
+async def format_range(
     spreadsheet_id: str, 
     sheet_name: str, 
     cell_range: str, 
@@ -305,121 +746,53 @@ def format_range(
     Returns:
         Status of the operation
     """
-    sheets = get_sheets_service()
+    sheets = await get_sheets_service()
     
-    # Convert range to GridRange format
-    grid_range = {
-        'sheetId': get_sheet_id(spreadsheet_id, sheet_name),
-        'startRowIndex': None,
-        'endRowIndex': None,
-        'startColumnIndex': None,
-        'endColumnIndex': None
-    }
+    # Convert range to GridRange format; one dict shared by every request below
+    grid_range = build_grid_range(await get_sheet_id(spreadsheet_id, sheet_name), cell_range)
     
-    # Parse cell range (e.g., "A1:B10")
-    import re
-    range_match = re.match(r'([A-Z]+)(\d+):([A-Z]+)(\d+)', cell_range)
-    if range_match:
-        start_col, start_row, end_col, end_row = range_match.groups()
-        grid_range['startRowIndex'] = int(start_row) - 1
-        grid_range['endRowIndex'] = int(end_row)
-        grid_range['startColumnIndex'] = column_letter_to_index(start_col)
-        grid_range['endColumnIndex'] = column_letter_to_index(end_col) + 1
-    else:
-        # Single cell (e.g., "A1")
-        single_match = re.match(r'([A-Z]+)(\d+)', cell_range)
-        if single_match:
-            col, row = single_match.groups()
-            grid_range['startRowIndex'] = int(row) - 1
-            grid_range['endRowIndex'] = int(row)
-            grid_range['startColumnIndex'] = column_letter_to_index(col)
-            grid_range['endColumnIndex'] = column_letter_to_index(col) + 1
-    
-    # Build format request
-    requests = []
+    # Build a single repeatCell request carrying every cell format option
+    cell_format = {}
+    fields = []
     
     # Background color
     if 'backgroundColor' in formatting:
-        requests.append({
-            'repeatCell': {
-                'range': grid_range,
-                'cell': {
-                    'userEnteredFormat': {
-                        'backgroundColor': parse_color(formatting['backgroundColor'])
-                    }
-                },
-                'fields': 'userEnteredFormat.backgroundColor'
-            }
-        })
+        cell_format['backgroundColor'] = parse_color(formatting['backgroundColor'])
+        fields.append('userEnteredFormat.backgroundColor')
     
     # Text format (bold, italic, etc.)
-    text_format = {}
-    if 'bold' in formatting:
-        text_format['bold'] = formatting['bold']
-    if 'italic' in formatting:
-        text_format['italic'] = formatting['italic']
-    if 'fontFamily' in formatting:
-        text_format['fontFamily'] = formatting['fontFamily']
-    if 'fontSize' in formatting:
-        text_format['fontSize'] = formatting['fontSize']
-    if 'foregroundColor' in formatting:
-        text_format['foregroundColor'] = parse_color(formatting['foregroundColor'])
-    
+    text_format = build_text_format(formatting)
     if text_format:
-        requests.append({
-            'repeatCell': {
-                'range': grid_range,
-                'cell': {
-                    'userEnteredFormat': {
-                        'textFormat': text_format
-                    }
-                },
-                'fields': f"userEnteredFormat.textFormat({','.join(text_format.keys())})"
-            }
-        })
+        cell_format['textFormat'] = text_format
+        fields.extend(f"userEnteredFormat.textFormat.{key}" for key in text_format)
     
     # Horizontal alignment
     if 'horizontalAlignment' in formatting:
-        requests.append({
-            'repeatCell': {
-                'range': grid_range,
-                'cell': {
-                    'userEnteredFormat': {
-                        'horizontalAlignment': formatting['horizontalAlignment'].upper()
-                    }
-                },
-                'fields': 'userEnteredFormat.horizontalAlignment'
-            }
-        })
+        cell_format['horizontalAlignment'] = formatting['horizontalAlignment'].upper()
+        fields.append('userEnteredFormat.horizontalAlignment')
     
     # Vertical alignment
     if 'verticalAlignment' in formatting:
-        requests.append({
-            'repeatCell': {
-                'range': grid_range,
-                'cell': {
-                    'userEnteredFormat': {
-                        'verticalAlignment': formatting['verticalAlignment'].upper()
-                    }
-                },
-                'fields': 'userEnteredFormat.verticalAlignment'
-            }
-        })
+        cell_format['verticalAlignment'] = formatting['verticalAlignment'].upper()
+        fields.append('userEnteredFormat.verticalAlignment')
     
     # Number format
     if 'numberFormat' in formatting:
+        cell_format['numberFormat'] = {
+            'type': formatting['numberFormat'].upper(),
+            'pattern': formatting.get('numberPattern', '')
+        }
+        fields.append('userEnteredFormat.numberFormat')
+    
+    requests = []
+    if cell_format:
         requests.append({
             'repeatCell': {
                 'range': grid_range,
                 'cell': {
-                    'userEnteredFormat': {
-                        'numberFormat': {
-                            'type': formatting['numberFormat'].upper(),
-                            'pattern': formatting.get('numberPattern', '')
-                        }
-                    }
+                    'userEnteredFormat': cell_format
                 },
-                'fields': 'userEnteredFormat.numberFormat'
+                'fields': ','.join(fields)
             }
         })
     
@@ -444,10 +817,12 @@ def format_range(
     body = {
         'requests': requests
     }
-    result = sheets.batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    # Formatting can change FORMATTED_VALUE reads
+    with _writing(spreadsheet_id):
+        result = await _execute(sheets.batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body=body
+        ))
     
     return {
         'replies': len(result.get('replies', [])),
@@ -455,7 +830,7 @@ def format_range(
     }
 
 @mcp.tool()
-def add_conditional_formatting(
+async def add_conditional_formatting(
     spreadsheet_id: str,
     sheet_name: str,
     cell_range: str,
@@ -476,26 +851,10 @@ def add_conditional_formatting(
     Returns:
         Status of the operation
     """
-    sheets = get_sheets_service()
+    sheets = await get_sheets_service()
     
     # Convert range to GridRange format
-    grid_range = {
-        'sheetId': get_sheet_id(spreadsheet_id, sheet_name),
-        'startRowIndex': None,
-        'endRowIndex': None,
-        'startColumnIndex': None,
-        'endColumnIndex': None
-    }
-    
-    # Parse cell range
-    import re
-    range_match = re.match(r'([A-Z]+)(\d+):([A-Z]+)(\d+)', cell_range)
-    if range_match:
-        start_col, start_row, end_col, end_row = range_match.groups()
-        grid_range['startRowIndex'] = int(start_row) - 1
-        grid_range['endRowIndex'] = int(end_row)
-        grid_range['startColumnIndex'] = column_letter_to_index(start_col)
-        grid_range['endColumnIndex'] = column_letter_to_index(end_col) + 1
+    grid_range = build_grid_range(await get_sheet_id(spreadsheet_id, sheet_name), cell_range)
     
     # Build conditional format
     condition = {
@@ -508,24 +867,12 @@ def add_conditional_formatting(
     
     # Background color
     if 'backgroundColor' in format_settings:
-        if 'backgroundColor' not in format_rule:
-            format_rule['backgroundColor'] = {}
         format_rule['backgroundColor'] = parse_color(format_settings['backgroundColor'])
     
     # Text format
-    if any(k in format_settings for k in ['bold', 'italic', 'fontFamily', 'fontSize', 'foregroundColor']):
-        format_rule['textFormat'] = {}
-        
-        if 'bold' in format_settings:
-            format_rule['textFormat']['bold'] = format_settings['bold']
-        if 'italic' in format_settings:
-            format_rule['textFormat']['italic'] = format_settings['italic']
-        if 'fontFamily' in format_settings:
-            format_rule['textFormat']['fontFamily'] = format_settings['fontFamily']
-        if 'fontSize' in format_settings:
-            format_rule['textFormat']['fontSize'] = format_settings['fontSize']
-        if 'foregroundColor' in format_settings:
-            format_rule['textFormat']['foregroundColor'] = parse_color(format_settings['foregroundColor'])
+    text_format = build_text_format(format_settings)
+    if text_format:
+        format_rule['textFormat'] = text_format
     
     # Create request
     request = {
@@ -545,53 +892,170 @@ def add_conditional_formatting(
     body = {
         'requests': [request]
     }
-    result = sheets.batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    # Formatting can change FORMATTED_VALUE reads
+    with _writing(spreadsheet_id):
+        result = await _execute(sheets.batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body=body
+        ))
     
     return {
         'replies': len(result.get('replies', [])),
         'status': 'success'
     }
 
+# Batch Operations
+
+@mcp.tool()
+async def batch_update(spreadsheet_id: str, requests: List[Dict]) -> Dict:
+    """Apply several spreadsheet changes (formatting, charts, conditional formats, etc.) in one request
+    
+    Args:
+        spreadsheet_id: The ID of the spreadsheet
+        requests: Google Sheets API batchUpdate requests (e.g., [{"repeatCell": {...}}, {"addChart": {...}}]),
+            applied in order
+        
+    Returns:
+        The reply for each request, in the same order
+    """
+    sheets = await get_sheets_service()
+    with _writing(spreadsheet_id):
+        try:
+            result = await _execute(sheets.batchUpdate(
+                spreadsheetId=spreadsheet_id,
+                body={'requests': requests}
+            ))
+        finally:
+            # Raw requests may add, delete or rename sheets (and a failed call may have applied)
+            _invalidate_sheet_ids(spreadsheet_id)
+    
+    return {
+        'replies': result.get('replies', []),
+        'status': 'success'
+    }
+
 # Helper functions
 
-def get_sheet_id(spreadsheet_id: str, sheet_name: str) -> int:
-    """Get the sheet ID from the sheet name"""
-    sheets = get_sheets_service()
-    spreadsheet = sheets.get(spreadsheetId=spreadsheet_id).execute()
+async def _batch_update_values(spreadsheet_id: str, data: List[Dict], value_input_option: str = 'USER_ENTERED') -> Dict:
+    """Write range/values entries in one values.batchUpdate, so they are applied all or nothing, in order"""
+    sheets = await get_sheets_service()
+    with _writing(spreadsheet_id):
+        result = await _execute(sheets.values().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={
+                'valueInputOption': value_input_option,
+                'includeValuesInResponse': False,
+                'data': data
+            }
+        ))
+    
+    return {
+        'total_updated_cells': result.get('totalUpdatedCells'),
+        'total_updated_sheets': result.get('totalUpdatedSheets')
+    }
+
+async def get_sheet_id(spreadsheet_id: str, sheet_name: str) -> int:
+    """Get the sheet ID from the sheet name, fetching the spreadsheet only on a cache miss"""
+    cached = _SHEET_IDS.get(spreadsheet_id)
+    if cached is not None:
+        fetched_at, sheet_ids = cached
+        if time.monotonic() - fetched_at < SHEET_ID_CACHE_TTL and sheet_name in sheet_ids:
+            return sheet_ids[sheet_name]
     
-    for sheet in spreadsheet.get('sheets', []):
-        if sheet.get('properties', {}).get('title') == sheet_name:
-            return sheet.get('properties', {}).get('sheetId')
+    # Concurrent misses for the same spreadsheet share one fetch
+    sheet_ids = await _single_flight(('sheet_ids', spreadsheet_id), lambda: _fetch_sheet_ids(spreadsheet_id))
+    if sheet_name in sheet_ids:
+        return sheet_ids[sheet_name]
     
     raise ValueError(f"Sheet '{sheet_name}' not found in spreadsheet")
 
+async def _fetch_sheet_ids(spreadsheet_id: str) -> Dict[str, int]:
+    """Fetch the sheet IDs by title for a spreadsheet and cache them"""
+    generation = _SHEET_ID_GENERATIONS.get(spreadsheet_id, 0)
+    sheets = await get_sheets_service(SHEETS_RO_SCOPES)
+    spreadsheet = await _execute(sheets.get(
+        spreadsheetId=spreadsheet_id,
+        fields='sheets.properties(sheetId,title)'  # Skip grid data and other metadata
+    ))
+    
+    # Remember every sheet in the spreadsheet, not just the one asked for
+    sheet_ids = {
+        sheet['properties']['title']: sheet['properties']['sheetId']
+        for sheet in spreadsheet.get('sheets', [])
+    }
+    
+    # A structural change that finished during the fetch may have made these stale
+    if _SHEET_ID_GENERATIONS.get(spreadsheet_id, 0) == generation:
+        _SHEET_IDS[spreadsheet_id] = (time.monotonic(), sheet_ids)
+    return sheet_ids
+
+def _invalidate_sheet_ids(spreadsheet_id: str):
+    """Forget a spreadsheet's sheet IDs, including any fetch already in flight"""
+    _SHEET_ID_GENERATIONS[spreadsheet_id] = _SHEET_ID_GENERATIONS.get(spreadsheet_id, 0) + 1
+    _SHEET_IDS.pop(spreadsheet_id, None)
+    _INFLIGHT.pop(('sheet_ids', spreadsheet_id), None)
+
+def build_grid_range(sheet_id: int, cell_range: str) -> Dict:
+    """Convert an A1 range (e.g., "A1:B10" or "A1") to a GridRange
+    
+    Only the bounds that could be parsed are included; missing bounds mean unbounded.
+    """
+    grid_range = {'sheetId': sheet_id}
+    bounds = _parse_a1_range(cell_range)
+    if bounds is not None:
+        (grid_range['startRowIndex'], grid_range['endRowIndex'],
+         grid_range['startColumnIndex'], grid_range['endColumnIndex']) = bounds
+    return grid_range
+
+@functools.lru_cache(maxsize=4096)
+def _parse_a1_range(cell_range: str):
+    """Parse an A1 range into (start row, end row, start column, end column) indexes, or None"""
+    range_match = _RANGE_RE.match(cell_range)
+    if range_match:
+        start_col, start_row, end_col, end_row = range_match.groups()
+    else:
+        # Single cell (e.g., "A1")
+        single_match = _CELL_RE.match(cell_range)
+        if not single_match:
+            return None
+        start_col, start_row = end_col, end_row = single_match.groups()
+    
+    return (
+        int(start_row) - 1,
+        int(end_row),
+        column_letter_to_index(start_col),
+        column_letter_to_index(end_col) + 1
+    )
+
+@functools.lru_cache(maxsize=1024)
 def column_letter_to_index(column: str) -> int:
     """Convert column letter (A, B, AA, etc.) to index (0, 1, 26, etc.)"""
+    # Fast paths for the common one and two letter columns
+    if len(column) == 1:
+        return ord(column) - 65
+    if len(column) == 2:
+        return (ord(column[0]) - 64) * 26 + ord(column[1]) - 65
+    
     result = 0
     for char in column:
         result = result * 26 + (ord(char) - ord('A') + 1)
     return result - 1
 
+def build_text_format(settings: Dict) -> Dict:
+    """Build a Google Sheets textFormat from formatting settings"""
+    text_format = {key: settings[key] for key in _TEXT_FORMAT_KEYS if key in settings}
+    if 'foregroundColor' in settings:
+        text_format['foregroundColor'] = parse_color(settings['foregroundColor'])
+    return text_format
+
 def parse_color(color_str: str) -> Dict:
     """Parse color string to Google Sheets color format"""
     # Handle named colors
-    named_colors = {
-        'black': {'red': 0, 'green': 0, 'blue': 0},
-        'white': {'red': 1, 'green': 1, 'blue': 1},
-        'red': {'red': 1, 'green': 0, 'blue': 0},
-        'green': {'red': 0, 'green': 1, 'blue': 0},
-        'blue': {'red': 0, 'green': 0, 'blue': 1},
-        'yellow': {'red': 1, 'green': 1, 'blue': 0},
-        'purple': {'red': 0.5, 'green': 0, 'blue': 0.5},
-        'orange': {'red': 1, 'green': 0.65, 'blue': 0},
-        'gray': {'red': 0.5, 'green': 0.5, 'blue': 0.5}
-    }
-    
-    if color_str.lower() in named_colors:
-        return named_colors[color_str.lower()]
+    named_color = _NAMED_COLORS.get(color_str.lower())
+    if named_color is not None:
+        # A new dict each call, since callers may add to it (e.g. alpha)
+        r, g, b = named_color
+        return {'red': r, 'green': g, 'blue': b}
     
     # Handle hex colors
     if color_str.startswith('#'):
@@ -600,15 +1064,16 @@ def parse_color(color_str: str) -> Dict:
             # Expand shorthand hex
             hex_color = ''.join([c*2 for c in hex_color])
         
-        r = int(hex_color[0:2], 16) / 255.0
-        g = int(hex_color[2:4], 16) / 255.0
-        b = int(hex_color[4:6], 16) / 255.0
+        # Parse once and split the channels with bit shifts
+        value = int(hex_color[:6], 16)
+        r = ((value >> 16) & 0xFF) / 255.0
+        g = ((value >> 8) & 0xFF) / 255.0
+        b = (value & 0xFF) / 255.0
         
         return {'red': r, 'green': g, 'blue': b}
     
     # Handle rgb colors
-    import re
-    rgb_match = re.match(r'rgb\((\d+),\s*(\d+),\s*(\d+)\)', color_str)
+    rgb_match = _RGB_RE.match(color_str)
     if rgb_match:
         r, g, b = map(int, rgb_match.groups())
         return {'red': r/255.0, 'green': g/255.0, 'blue': b/255.0}
@@ -619,7 +1084,7 @@ def parse_color(color_str: str) -> Dict:
 # Sheet Listing Operations
 
 @mcp.tool()
-def list_sheets(filter_term: str = None) -> List[Dict]:
+async def list_sheets(filter_term: str = None) -> List[Dict]:
     """List Google Sheets the user has access to
     
     Args:
@@ -628,24 +1093,24 @@ def list_sheets(filter_term: str = None) -> List[Dict]:
     Returns:
         List of sheets with their names and IDs
     """
-    drive = get_drive_service()
+    drive = await get_drive_service()
     query = "mimeType='application/vnd.google-apps.spreadsheet'"
     
     # Add name filter if provided
     if filter_term:
         query += f" and name contains '{filter_term}'"
         
-    results = drive.files().list(
+    results = await _execute(drive.files().list(
         q=query,
         fields="files(id, name, createdTime, modifiedTime, webViewLink)",
         orderBy="modifiedTime desc"
-    ).execute()
+    ))
     
     return results.get('files', [])
 
 # Resource for accessing sheet data directly
 @mcp.resource("sheets://{spreadsheet_id}/{sheet_name}")
-def get_sheet_data(spreadsheet_id: str, sheet_name: str) -> str:
+async def get_sheet_data(spreadsheet_id: str, sheet_name: str) -> str:
     """Get data from a Google Sheet
     
     Args:
@@ -655,13 +1120,16 @@ def get_sheet_data(spreadsheet_id: str, sheet_name: str) -> str:
     Returns:
         JSON string with sheet data
     """
-    sheets = get_sheets_service()
-    result = sheets.values().get(
+    sheets = await get_sheets_service(SHEETS_RO_SCOPES)
+    result = await _execute(sheets.values().get(
         spreadsheetId=spreadsheet_id,
-        range=sheet_name
-    ).execute()
+        range=sheet_name,
+        valueRenderOption='UNFORMATTED_VALUE',
+        fields='values'
+    ))
     
-    return json.dumps(result.get('values', []), indent=2)
+    # Compact output; the resource is consumed by the model, not read by people
+    return json.dumps(result.get('values', []), separators=(',', ':'))
 
 def main():
     """Main entry point for the MCP server"""
@@ -672,7 +1140,9 @@ def main():
     tool_functions = [
         "list_sheets",  # Added new tool for listing sheets
         "read_sheet", "write_sheet", "append_sheet", "update_cell",
-        "add_formula", "batch_add_formulas", "format_range", "add_conditional_formatting"
+        "batch_read_sheet", "batch_write_sheet",
+        "add_formula", "batch_add_formulas", "format_range", "add_conditional_formatting",
+        "batch_update"
     ]
     for tool_name in tool_functions:
         print(f"  - {tool_name}")
@@ -682,6 +1152,14 @@ def main():
     for resource in resource_functions:
         print(f"  - {resource}")
     print("Server running. Press Ctrl+C to exit.")
+    
+    # Use uvloop's faster event loop when it is installed (the "speedups" extra)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     mcp.run()
 
 if __name__ == "__main__":
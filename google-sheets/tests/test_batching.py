@@ -0,0 +1,201 @@
+import asyncio
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+import server
+
+
+class FakeValues:
+    """Builds values requests as (method, kwargs) and records the ones executed"""
+
+    def __init__(self):
+        self.requests = []
+
+    def batchGet(self, **kwargs):
+        return ('batchGet', kwargs)
+
+    def batchUpdate(self, **kwargs):
+        return ('batchUpdate', kwargs)
+
+
+class FakeSheets:
+    def __init__(self):
+        self._values = FakeValues()
+
+    def values(self):
+        return self._values
+
+
+def _bad_request():
+    return HttpError(httplib2.Response({'status': 400}), b'{"error": {"message": "Unable to parse range"}}')
+
+
+@pytest.fixture
+def sheets(monkeypatch):
+    fake = FakeSheets()
+
+    async def get_sheets_service(scopes=server.SHEETS_RW_SCOPES):
+        return fake
+
+    async def execute(request):
+        method, kwargs = request
+        fake.values().requests.append(request)
+        if method == 'batchGet':
+            if any(r.startswith('Bad!') for r in kwargs['ranges']):
+                raise _bad_request()
+            return {'valueRanges': [{'values': [[r]]} for r in kwargs['ranges']]}
+        data = kwargs['body']['data']
+        if any(d['range'].startswith('Bad!') for d in data):
+            raise _bad_request()
+        return {'responses': [{'updatedCells': 1, 'updatedRange': d['range']} for d in data]}
+
+    monkeypatch.setattr(server, 'get_sheets_service', get_sheets_service)
+    monkeypatch.setattr(server, '_execute', execute)
+    monkeypatch.setattr(server, '_READS', server._ReadBatcher())
+    monkeypatch.setattr(server, '_WRITES', server._WriteBatcher())
+    return fake.values()
+
+
+def test_invalid_write_does_not_fail_other_writes(sheets):
+    async def run():
+        return await asyncio.gather(
+            server.update_cell('x', 'Sheet1', 'A1', '1'),
+            server.update_cell('x', 'Bad', 'A1', '2'),
+            server.write_sheet('x', 'Sheet1!B2', [['3']]),
+            return_exceptions=True
+        )
+
+    first, bad, last = asyncio.run(run())
+    assert first == {'updated_cells': 1, 'updated_range': 'Sheet1!A1'}
+    assert isinstance(bad, HttpError) and bad.status_code == 400
+    assert last == {'updated_cells': 1, 'updated_range': 'Sheet1!B2'}
+    # One rejected batch, then one request per write
+    assert len(sheets.requests) == 4
+
+
+def test_writes_are_batched(sheets):
+    async def run():
+        return await asyncio.gather(
+            server.update_cell('x', 'Sheet1', 'A1', '1'),
+            server.update_cell('x', 'Sheet1', 'A2', '2')
+        )
+
+    assert [r['updated_range'] for r in asyncio.run(run())] == ['Sheet1!A1', 'Sheet1!A2']
+    assert len(sheets.requests) == 1
+
+
+def test_invalid_read_does_not_fail_other_reads(sheets):
+    async def run():
+        return await asyncio.gather(
+            server.read_sheet('x', 'Sheet1!A1'),
+            server.read_sheet('x', 'Bad!A1'),
+            server.read_sheet('x', 'Sheet1!B2'),
+            return_exceptions=True
+        )
+
+    first, bad, last = asyncio.run(run())
+    assert first == [['Sheet1!A1']]
+    assert isinstance(bad, HttpError) and bad.status_code == 400
+    assert last == [['Sheet1!B2']]
+
+
+def test_reads_are_batched(sheets):
+    async def run():
+        return await asyncio.gather(
+            server.read_sheet('x', 'Sheet1!A1'),
+            server.read_sheet('x', 'Sheet1!B2')
+        )
+
+    assert asyncio.run(run()) == [[['Sheet1!A1']], [['Sheet1!B2']]]
+    assert len(sheets.requests) == 1
+
+
+def test_slow_batch_does_not_delay_other_spreadsheets(sheets, monkeypatch):
+    execute = server._execute
+
+    async def slow_execute(request):
+        if request[1]['spreadsheetId'] == 'slow':
+            await asyncio.sleep(1)
+        return await execute(request)
+
+    monkeypatch.setattr(server, '_execute', slow_execute)
+
+    async def run():
+        slow = asyncio.create_task(server.read_sheet('slow', 'Sheet1!A1'))
+        await asyncio.sleep(0.05)  # Let the slow read be flushed first
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await server.read_sheet('fast', 'Sheet1!A1')
+        elapsed = loop.time() - start
+        await slow
+        return elapsed
+
+    assert asyncio.run(run()) < 0.5
+
+
+def test_read_after_write_does_not_join_earlier_read(sheets, monkeypatch):
+    execute = server._execute
+    release = asyncio.Event()
+
+    async def held_execute(request):
+        # Hold the first read in flight until the test releases it
+        if request[0] == 'batchGet' and not release.is_set():
+            await release.wait()
+        return await execute(request)
+
+    monkeypatch.setattr(server, '_execute', held_execute)
+
+    async def run():
+        before = asyncio.create_task(server.read_sheet('x', 'Sheet1!A1'))
+        await asyncio.sleep(0.05)
+        await server.update_cell('x', 'Sheet1', 'A1', 'new')
+        after = asyncio.create_task(server.read_sheet('x', 'Sheet1!A1'))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(before, after)
+
+    asyncio.run(run())
+    # The read started after the write was sent on its own
+    assert [method for method, _ in sheets.requests].count('batchGet') == 2
+
+
+def test_read_after_write_does_not_join_read_started_during_it(sheets, monkeypatch):
+    cells = {'Sheet1!A1': 'old'}
+    write_sent = asyncio.Event()
+    release_write = asyncio.Event()
+    read_sent = asyncio.Event()
+    release_read = asyncio.Event()
+
+    async def stateful_execute(request):
+        method, kwargs = request
+        sheets.requests.append(request)
+        if method == 'batchUpdate':
+            write_sent.set()
+            await release_write.wait()
+            for d in kwargs['body']['data']:
+                cells[d['range']] = d['values'][0][0]
+            return {'responses': [{'updatedCells': 1, 'updatedRange': d['range']} for d in kwargs['body']['data']]}
+        values = [[cells[r]] for r in kwargs['ranges']]
+        read_sent.set()
+        await release_read.wait()
+        return {'valueRanges': [{'values': [v]} for v in values]}
+
+    monkeypatch.setattr(server, '_execute', stateful_execute)
+
+    async def run():
+        write = asyncio.create_task(server.update_cell('x', 'Sheet1', 'A1', 'new'))
+        await write_sent.wait()
+        during = asyncio.create_task(server.read_sheet('x', 'Sheet1!A1'))
+        await read_sent.wait()
+        release_write.set()
+        await write
+        after = asyncio.create_task(server.read_sheet('x', 'Sheet1!A1'))
+        await asyncio.sleep(0)
+        release_read.set()
+        return await asyncio.gather(during, after)
+
+    during, after = asyncio.run(run())
+    assert during == [['old']]
+    assert after == [['new']]
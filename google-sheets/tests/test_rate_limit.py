@@ -0,0 +1,89 @@
+import asyncio
+
+import httplib2
+import pytest
+
+import server
+
+
+class FakeClock:
+    """Stands in for time.monotonic and asyncio.sleep, so waits take no real time"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(server.time, 'monotonic', fake.monotonic)
+    monkeypatch.setattr(server.asyncio, 'sleep', fake.sleep)
+    return fake
+
+
+def _send_times(clock, limiter, count, spacing):
+    async def run():
+        times = []
+        for _ in range(count):
+            await limiter.acquire()
+            times.append(clock.now)
+            clock.now += spacing
+        return times
+
+    return asyncio.run(run())
+
+
+def test_no_rolling_minute_exceeds_the_limit(clock):
+    times = _send_times(clock, server._RateLimiter(60), 200, 0.01)
+    assert max(sum(1 for t in times if start <= t < start + 60) for start in times) == 60
+
+
+def test_requests_within_the_limit_do_not_wait(clock):
+    times = _send_times(clock, server._RateLimiter(60), 60, 0.5)
+    assert times[-1] == pytest.approx(59 * 0.5)
+
+
+def test_zero_disables_the_limit(clock):
+    times = _send_times(clock, server._RateLimiter(0), 500, 0)
+    assert times[-1] == 0
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.acquired = 0
+
+    async def acquire(self):
+        self.acquired += 1
+
+
+class FakeRequest:
+    def __init__(self, method, method_id):
+        self.method = method
+        self.methodId = method_id
+        self.http = httplib2.Http()
+        self.http.credentials = None
+
+    def execute(self, http=None):
+        return {}
+
+
+def test_only_sheets_requests_are_throttled(monkeypatch):
+    reads, writes = CountingLimiter(), CountingLimiter()
+    monkeypatch.setattr(server, '_READ_LIMIT', reads)
+    monkeypatch.setattr(server, '_WRITE_LIMIT', writes)
+    monkeypatch.setattr(server, '_refresh_credentials', lambda creds: creds)
+    monkeypatch.setattr(server, '_thread_http', lambda creds: None)
+
+    async def run():
+        await server._execute(FakeRequest('GET', 'drive.files.list'))
+        await server._execute(FakeRequest('GET', 'sheets.spreadsheets.values.get'))
+        await server._execute(FakeRequest('POST', 'sheets.spreadsheets.values.batchUpdate'))
+
+    asyncio.run(run())
+    assert (reads.acquired, writes.acquired) == (1, 1)
@@ -0,0 +1,81 @@
+import asyncio
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+import server
+
+
+class FakeRequest:
+    """Fails with the given errors in turn, then succeeds"""
+
+    def __init__(self, method, method_id, errors):
+        self.method = method
+        self.methodId = method_id
+        self.http = httplib2.Http()
+        self.http.credentials = None
+        self.errors = list(errors)
+        self.attempts = 0
+
+    def execute(self, http=None):
+        self.attempts += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {}
+
+
+def _http_error(status, headers=None):
+    return HttpError(httplib2.Response({'status': status, **(headers or {})}), b'{}')
+
+
+# Captured before the fixture replaces it
+retry_delay = server._retry_delay
+
+
+def test_retry_after_is_honored():
+    assert retry_delay(_http_error(429, {'retry-after': '7'}), 0) == 7
+    assert retry_delay(_http_error(429, {'retry-after': '3600'}), 0) == server.RETRY_MAX_WAIT
+    assert 0 <= retry_delay(_http_error(503), 3) <= 8
+
+
+@pytest.fixture(autouse=True)
+def no_waiting(monkeypatch):
+    monkeypatch.setattr(server, '_refresh_credentials', lambda creds: creds)
+    monkeypatch.setattr(server, '_thread_http', lambda creds: None)
+    monkeypatch.setattr(server, '_retry_delay', lambda error, attempt: 0)
+    monkeypatch.setattr(server, '_READ_LIMIT', server._RateLimiter(0))
+    monkeypatch.setattr(server, '_WRITE_LIMIT', server._RateLimiter(0))
+
+
+def test_read_is_retried_after_server_error():
+    request = FakeRequest('GET', 'sheets.spreadsheets.values.get', [_http_error(503)])
+    assert asyncio.run(server._execute(request)) == {}
+    assert request.attempts == 2
+
+
+def test_append_is_not_retried_after_server_error():
+    request = FakeRequest('POST', 'sheets.spreadsheets.values.append', [_http_error(503)])
+    with pytest.raises(HttpError):
+        asyncio.run(server._execute(request))
+    assert request.attempts == 1
+
+
+def test_append_is_retried_after_rate_limiting():
+    request = FakeRequest('POST', 'sheets.spreadsheets.values.append', [_http_error(429)])
+    assert asyncio.run(server._execute(request)) == {}
+    assert request.attempts == 2
+
+
+def test_timeout_is_not_retried():
+    request = FakeRequest('GET', 'sheets.spreadsheets.values.get', [TimeoutError()])
+    with pytest.raises(TimeoutError):
+        asyncio.run(server._execute(request))
+    assert request.attempts == 1
+
+
+def test_bad_request_is_not_retried():
+    request = FakeRequest('GET', 'sheets.spreadsheets.values.get', [_http_error(400)])
+    with pytest.raises(HttpError):
+        asyncio.run(server._execute(request))
+    assert request.attempts == 1
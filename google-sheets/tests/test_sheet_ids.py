@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+import server
+
+
+class FakeSpreadsheets:
+    """Builds spreadsheet requests as (method, kwargs)"""
+
+    def get(self, **kwargs):
+        return ('get', kwargs)
+
+    def batchUpdate(self, **kwargs):
+        return ('batchUpdate', kwargs)
+
+
+@pytest.fixture
+def spreadsheet(monkeypatch):
+    state = {'sheet_ids': {'Data': 1}, 'fetches': 0, 'hold': None}
+
+    async def get_sheets_service(scopes=server.SHEETS_RW_SCOPES):
+        return FakeSpreadsheets()
+
+    async def execute(request):
+        method, kwargs = request
+        if method == 'batchUpdate':
+            # Delete and re-add the sheet, giving it a new ID
+            state['sheet_ids'] = {'Data': 2}
+            return {'replies': []}
+        state['fetches'] += 1
+        sheet_ids = dict(state['sheet_ids'])
+        if state['hold'] is not None:
+            await state['hold'].wait()
+        return {'sheets': [{'properties': {'title': t, 'sheetId': i}} for t, i in sheet_ids.items()]}
+
+    monkeypatch.setattr(server, 'get_sheets_service', get_sheets_service)
+    monkeypatch.setattr(server, '_execute', execute)
+    monkeypatch.setattr(server, '_SHEET_IDS', {})
+    monkeypatch.setattr(server, '_SHEET_ID_GENERATIONS', {})
+    monkeypatch.setattr(server, '_INFLIGHT', {})
+    return state
+
+
+def test_sheet_ids_are_cached(spreadsheet):
+    async def run():
+        return [await server.get_sheet_id('x', 'Data') for _ in range(3)]
+
+    assert asyncio.run(run()) == [1, 1, 1]
+    assert spreadsheet['fetches'] == 1
+
+
+def test_fetch_started_before_batch_update_is_not_cached(spreadsheet):
+    async def run():
+        spreadsheet['hold'] = asyncio.Event()
+        stale = asyncio.create_task(server.get_sheet_id('x', 'Data'))
+        while not spreadsheet['fetches']:
+            await asyncio.sleep(0)
+        await server.batch_update('x', [{'deleteSheet': {}}, {'addSheet': {}}])
+        spreadsheet['hold'].set()
+        spreadsheet['hold'] = None
+        await stale
+        return await server.get_sheet_id('x', 'Data')
+
+    assert asyncio.run(run()) == 2